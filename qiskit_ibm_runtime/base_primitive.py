@@ -128,14 +128,15 @@ class BasePrimitiveV2(ABC, Generic[OptionsT]):
         primitive_inputs.update(primitive_options)
         runtime_options = self._options_class._get_runtime_options(options_dict)
 
-        validate_no_dd_with_dynamic_circuits([pub.circuit for pub in pubs], self.options)
+        circuits = [pub.circuit for pub in pubs]
+        validate_no_dd_with_dynamic_circuits(circuits, self.options)
         if self._backend:
-            for pub in pubs:
-                if getattr(self._backend, "target", None) and not is_simulator(self._backend):
-                    validate_isa_circuits([pub.circuit], self._backend.target)
+            if getattr(self._backend, "target", None) and not is_simulator(self._backend):
+                validate_isa_circuits(circuits, self._backend.target)
 
-                if isinstance(self._backend, IBMBackend):
-                    self._backend.check_faulty(pub.circuit)
+            if isinstance(self._backend, IBMBackend):
+                for circuit in circuits:
+                    self._backend.check_faulty(circuit)
 
         logger.info("Submitting job using options %s", primitive_options)
 
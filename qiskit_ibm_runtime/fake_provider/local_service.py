@@ -14,11 +14,11 @@
 
 from __future__ import annotations
 
-import copy
 import logging
 import warnings
 from dataclasses import asdict
-from typing import Callable, Dict, List, Literal, Optional, Union
+from itertools import chain
+from typing import Callable, Dict, List, Literal, Optional, Tuple, Union
 
 from qiskit.primitives import (
     BackendEstimator,
@@ -40,6 +40,30 @@ from ..runtime_options import RuntimeOptions
 logger = logging.getLogger(__name__)
 
 
+def _parse_v1_options(options: dict) -> Tuple[dict, bool, dict]:
+    """Extract the settings used by the local V1 primitives from their program inputs.
+
+    The given options are not modified.
+
+    Args:
+        options: Primitive options to use.
+
+    Returns:
+        The transpilation options, whether to skip transpilation, and the run options.
+    """
+    transpilation_options = dict(options.get("transpilation_settings", {}))
+    skip_transpilation = transpilation_options.pop("skip_transpilation", False)
+    optimization_level = transpilation_options.pop("optimization_settings", {}).get("level")
+    transpilation_options["optimization_level"] = optimization_level
+    input_run_options = options.get("run_options", {})
+    run_options = {
+        "shots": input_run_options.get("shots"),
+        "seed_simulator": input_run_options.get("seed_simulator"),
+        "noise_model": input_run_options.get("noise_model"),
+    }
+    return transpilation_options, skip_transpilation, run_options
+
+
 class QiskitRuntimeLocalService:
     """Class for local testing mode."""
 
@@ -52,6 +76,8 @@ class QiskitRuntimeLocalService:
 
         """
         self._channel_strategy = None
+        self._fake_backends: Optional[Dict[str, FakeBackendV2]] = None
+        self._primitives_v2: Dict[tuple, BackendSamplerV2 | BackendEstimatorV2] = {}
 
     def backend(self, name: str = None) -> FakeBackendV2:
         """Return a single fake backend matching the specified filters.
@@ -73,6 +99,10 @@ class QiskitRuntimeLocalService:
     ) -> List[FakeBackendV2]:
         """Return all the available fake backends, subject to optional filtering.
 
+        The fake backends are instantiated once per service, so every call returns the same
+        backend instances, and changes made to one of them (e.g. with ``set_options``) are
+        visible to later calls.
+
         Args:
             name: Backend name to filter by.
             min_num_qubits: Minimum number of qubits the fake backend has to have.
@@ -96,16 +126,16 @@ class QiskitRuntimeLocalService:
             QiskitBackendNotFoundError: If none of the available fake backends matches the given
                 filters.
         """
-        backends = FakeProviderForBackendV2().backends(name)
+        if self._fake_backends is None:
+            self._fake_backends = {b.name: b for b in FakeProviderForBackendV2().backends()}
         err = QiskitBackendNotFoundError("No backend matches the criteria.")
 
         if name:
-            for b in backends:
-                if b.name == name:
-                    backends = [b]
-                    break
-            else:
+            if name not in self._fake_backends:
                 raise err
+            backends = [self._fake_backends[name]]
+        else:
+            backends = list(self._fake_backends.values())
 
         if min_num_qubits:
             backends = [b for b in backends if b.num_qubits >= min_num_qubits]
@@ -161,7 +191,7 @@ class QiskitRuntimeLocalService:
             NotImplementedError: If using V2 primitives.
         """
         if isinstance(options, Dict):
-            qrt_options = copy.deepcopy(options)
+            qrt_options = dict(options)
         else:
             qrt_options = asdict(options)
 
@@ -179,7 +209,7 @@ class QiskitRuntimeLocalService:
                 "Please pass a backend instance."
             )
 
-        inputs = copy.deepcopy(inputs)
+        inputs = dict(inputs)
         primitive_version = inputs.pop("version", 1)
         if primitive_version == 1:
             primitive_inputs = {
@@ -214,6 +244,48 @@ class QiskitRuntimeLocalService:
                 inputs=primitive_inputs,
             )
 
+    def run_batch(
+        self,
+        program_id: Literal["sampler", "estimator"],
+        inputs_list: List[Dict],
+        options: Union[RuntimeOptions, Dict],
+    ) -> PrimitiveJob:
+        """Execute several V2 runtime program requests as a single job.
+
+        The PUBs of all the requests are run together by a single primitive instance, and the
+        PUB results are returned in the order in which the PUBs appear across ``inputs_list``.
+
+        Args:
+            program_id: Program ID.
+            inputs_list: A list of program input parameters, each as accepted by :meth:`run`.
+                All of them must be V2 primitive inputs with the same primitive options.
+            options: Runtime options that control the execution environment.
+                See :class:`RuntimeOptions` for all available options.
+
+        Returns:
+            A job representing the execution of all the PUBs.
+
+        Raises:
+            ValueError: If input is invalid.
+        """
+        if not inputs_list:
+            raise ValueError("At least one set of inputs is required.")
+        if any(inputs.get("version", 1) != 2 for inputs in inputs_list):
+            raise ValueError("Only V2 primitive inputs can be batched in local testing mode.")
+        if any("pubs" not in inputs for inputs in inputs_list):
+            raise ValueError("All batched inputs must contain pubs.")
+
+        primitive_options = inputs_list[0].get("options", {})
+        if any(inputs.get("options", {}) != primitive_options for inputs in inputs_list[1:]):
+            raise ValueError("All batched inputs must use the same primitive options.")
+
+        inputs = {
+            "pubs": list(chain.from_iterable(inputs["pubs"] for inputs in inputs_list)),
+            "version": 2,
+            "options": primitive_options,
+        }
+        return self.run(program_id=program_id, inputs=inputs, options=options)
+
     def _run_aer_primitive_v1(
         self, primitive: Literal["sampler", "estimator"], options: dict, inputs: dict
     ) -> PrimitiveJob:
@@ -231,19 +303,8 @@ class QiskitRuntimeLocalService:
         from qiskit_aer.primitives import Estimator, Sampler
 
         # TODO: issue warning if extra options are used
-        options_copy = copy.deepcopy(options)
-        transpilation_options = options_copy.get("transpilation_settings", {})
-        skip_transpilation = transpilation_options.pop("skip_transpilation", False)
-        optimization_level = transpilation_options.pop("optimization_settings", {}).pop(
-            "level", None
-        )
-        transpilation_options["optimization_level"] = optimization_level
-        input_run_options = options_copy.get("run_options", {})
-        run_options = {
-            "shots": input_run_options.pop("shots", None),
-            "seed_simulator": input_run_options.pop("seed_simulator", None),
-        }
-        backend_options = {"noise_model": input_run_options.pop("noise_model", None)}
+        transpilation_options, skip_transpilation, run_options = _parse_v1_options(options)
+        backend_options = {"noise_model": run_options.pop("noise_model")}
 
         if primitive == "sampler":
             primitive_inst = Sampler(
@@ -279,17 +340,7 @@ class QiskitRuntimeLocalService:
         Returns:
             The job object of the result of the primitive.
         """
-        options_copy = copy.deepcopy(options)
-        transpilation_options = options_copy.get("transpilation_settings", {})
-        skip_transpilation = transpilation_options.pop("skip_transpilation", False)
-        optimization_level = transpilation_options.pop("optimization_settings", {}).get("level")
-        transpilation_options["optimization_level"] = optimization_level
-        input_run_options = options.get("run_options", {})
-        run_options = {
-            "shots": input_run_options.get("shots"),
-            "seed_simulator": input_run_options.get("seed_simulator"),
-            "noise_model": input_run_options.get("noise_model"),
-        }
+        transpilation_options, skip_transpilation, run_options = _parse_v1_options(options)
         if primitive == "sampler":
             primitive_inst = BackendSampler(backend=backend, skip_transpilation=skip_transpilation)
         else:
@@ -316,21 +367,29 @@ class QiskitRuntimeLocalService:
         Returns:
             The job object of the result of the primitive.
         """
-        options_copy = copy.deepcopy(options)
+        options_copy = dict(options)
 
         prim_options = {}
-        if seed_simulator := options_copy.pop("simulator", {}).pop("seed_simulator", None):
+        simulator_options = options_copy.pop("simulator", None) or {}
+        if (seed_simulator := simulator_options.get("seed_simulator")) is not None:
             prim_options["seed_simulator"] = seed_simulator
         if primitive == "sampler":
-            if default_shots := options_copy.pop("default_shots", None):
+            if (default_shots := options_copy.pop("default_shots", None)) is not None:
                 prim_options["default_shots"] = default_shots
-            primitive_inst = BackendSamplerV2(backend=backend, options=prim_options)
         else:
-            if default_precision := options_copy.pop("default_precision", None):
+            if (default_precision := options_copy.pop("default_precision", None)) is not None:
                 prim_options["default_precision"] = default_precision
-            primitive_inst = BackendEstimatorV2(backend=backend, options=prim_options)
 
         if options_copy:
             warnings.warn(f"Options {options_copy} have no effect in local testing mode.")
 
+        # Reuse the primitive built for the same backend and options by a previous call
+        key = (backend, primitive, tuple(sorted(prim_options.items())))
+        if (primitive_inst := self._primitives_v2.get(key)) is None:
+            if primitive == "sampler":
+                primitive_inst = BackendSamplerV2(backend=backend, options=prim_options)
+            else:
+                primitive_inst = BackendEstimatorV2(backend=backend, options=prim_options)
+            self._primitives_v2[key] = primitive_inst
+
         return primitive_inst.run(**inputs)
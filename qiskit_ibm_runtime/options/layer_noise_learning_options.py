@@ -70,6 +70,6 @@ class LayerNoiseLearningOptions:
     @classmethod
     @skip_unset_validation
     def _nonnegative_list(cls, value: List[int], info: ValidationInfo) -> List[int]:
-        if any(i < 0 for i in value):
+        if value and min(value) < 0:
             raise ValueError(f"`{cls.__name__}.{info.field_name}` option value must all be >= 0")
         return value
@@ -11,8 +11,12 @@
 # that they have been altered from the originals.
 
 """Test of generated fake backends."""
+import copy
+from unittest import mock
+
 from ddt import data, ddt
 
+from qiskit import QuantumCircuit
 from qiskit.providers.exceptions import QiskitBackendNotFoundError
 
 from qiskit_ibm_runtime.fake_provider.fake_backend import FakeBackendV2
@@ -41,6 +45,15 @@ class QiskitRuntimeLocalServiceTest(IBMTestCase):
         for b1, b2 in zip(all_backends, expected):
             assert isinstance(b1, b2.__class__)
 
+    def test_backends_cached(self):
+        """Tests that the fake backends are only instantiated once per service."""
+        service = QiskitRuntimeLocalService()
+        assert service.backend("fake_torino") is service.backend("fake_torino")
+
+        backends = service.backends()
+        backends.clear()
+        assert service.backends()
+
     def test_backends_name_filter(self):
         """Tests the ``name`` filter of the ``backends`` method."""
         backends = QiskitRuntimeLocalService().backends("fake_torino")
@@ -95,3 +108,101 @@ class QiskitRuntimeLocalServiceTest(IBMTestCase):
     def test_least_busy(self):
         """Tests the ``least_busy`` method."""
         assert isinstance(QiskitRuntimeLocalService().least_busy(), FakeBackendV2)
+
+    def test_run_does_not_mutate_inputs(self):
+        """Tests that the ``run`` method leaves the given inputs and options untouched."""
+        circuit = QuantumCircuit(1)
+        circuit.x(0)
+        circuit.measure_all()
+
+        inputs = {
+            "pubs": [(circuit,)],
+            "version": 2,
+            "options": {"default_shots": 10, "simulator": {"seed_simulator": 42}},
+        }
+        options = {"backend": FakeAlgiers()}
+        inputs_copy = copy.copy(inputs)
+        options_copy = copy.copy(options)
+
+        job = QiskitRuntimeLocalService().run("sampler", inputs, options)
+        assert job.result()[0].data.meas.num_shots == 10
+        assert inputs == inputs_copy
+        assert inputs["options"] == {"default_shots": 10, "simulator": {"seed_simulator": 42}}
+        assert options == options_copy
+
+    def test_run_zero_seed_simulator(self):
+        """Tests that a ``seed_simulator`` of zero is passed on to the primitive."""
+        circuit = QuantumCircuit(1)
+        circuit.h(0)
+        circuit.measure_all()
+
+        counts = []
+        for _ in range(2):
+            inputs = {
+                "pubs": [(circuit,)],
+                "version": 2,
+                "options": {"default_shots": 1000, "simulator": {"seed_simulator": 0}},
+            }
+            job = QiskitRuntimeLocalService().run("sampler", inputs, {"backend": FakeAlgiers()})
+            counts.append(job.result()[0].data.meas.get_counts())
+        assert counts[0] == counts[1]
+
+    def test_run_reuses_primitives(self):
+        """Tests that the ``run`` method reuses primitives built for the same backend and options."""
+        service = QiskitRuntimeLocalService()
+        circuit = QuantumCircuit(1)
+        circuit.measure_all()
+        inputs = {"pubs": [(circuit,)], "version": 2, "options": {"default_shots": 10}}
+        options = {"backend": FakeAlgiers()}
+
+        service.run("sampler", inputs, options).result()
+        primitive_inst = next(iter(service._primitives_v2.values()))
+        with mock.patch.object(primitive_inst, "run", wraps=primitive_inst.run) as mock_run:
+            service.run("sampler", inputs, options).result()
+        mock_run.assert_called_once()
+        assert next(iter(service._primitives_v2.values())) is primitive_inst
+
+        other_inputs = {"pubs": [(circuit,)], "version": 2, "options": {"default_shots": 20}}
+        service.run("sampler", other_inputs, options).result()
+        assert len(service._primitives_v2) == 2
+
+    def test_run_batch(self):
+        """Tests the ``run_batch`` method."""
+        circuit = QuantumCircuit(1)
+        circuit.x(0)
+        circuit.measure_all()
+
+        primitive_options = {"default_shots": 10, "simulator": {"seed_simulator": 42}}
+        inputs_list = [
+            {"pubs": [(circuit,)], "version": 2, "options": primitive_options},
+            {"pubs": [(circuit, None, 20), (circuit,)], "version": 2, "options": primitive_options},
+        ]
+        job = QiskitRuntimeLocalService().run_batch(
+            "sampler", inputs_list, {"backend": FakeAlgiers()}
+        )
+        result = job.result()
+        assert len(result) == 3
+        assert [r.data.meas.num_shots for r in result] == [10, 20, 10]
+
+    def test_run_batch_errors(self):
+        """Tests the errors raised by the ``run_batch`` method."""
+        service = QiskitRuntimeLocalService()
+        circuit = QuantumCircuit(1)
+        circuit.measure_all()
+        options = {"backend": FakeAlgiers()}
+
+        with self.assertRaisesRegex(ValueError, "At least one"):
+            service.run_batch("sampler", [], options)
+        with self.assertRaisesRegex(ValueError, "Only V2"):
+            service.run_batch("sampler", [{"pubs": [(circuit,)]}], options)
+        with self.assertRaisesRegex(ValueError, "must contain pubs"):
+            service.run_batch("sampler", [{"version": 2}], options)
+        with self.assertRaisesRegex(ValueError, "same primitive options"):
+            service.run_batch(
+                "sampler",
+                [
+                    {"pubs": [(circuit,)], "version": 2, "options": {"default_shots": 10}},
+                    {"pubs": [(circuit,)], "version": 2, "options": {"default_shots": 20}},
+                ],
+                options,
+            )